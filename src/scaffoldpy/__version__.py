@@ -1,5 +1,7 @@
 """The `version` module holds the version information for ujson5."""
 
+from functools import cache
+
 from scaffoldpy._version import __version__
 
 __all__ = ["VERSION"]
@@ -8,6 +10,7 @@ VERSION: str = __version__
 """The version of ujson5."""
 
 
+@cache
 def version_short() -> str:  # pragma: no cover
     """Return the `major.minor` part of ujson5 version.
 
@@ -16,6 +19,7 @@ def version_short() -> str:  # pragma: no cover
     return ".".join(VERSION.split(".")[:2])
 
 
+@cache
 def version_info() -> str:
     """Return complete version information for scaffoldpy and its dependencies."""
     import platform  # pylint: disable=C0415
@@ -1,79 +1,91 @@
 """Builders for creating a new Python project."""
 
+import copy
 import json
+import os
 import subprocess
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-
-import toml
+from typing import Callable
 
 from scaffoldpy import consts, models, templates
+from scaffoldpy.utils import WriteBatch
+
+
+_BUILD_SYSTEMS: dict[str, models.BuildSystem] = {
+    "Setuptools": {
+        "build-backend": "setuptools.build_meta",
+        "requires": ["setuptools"],
+    },
+    "Poetry-core": {
+        "build-backend": "poetry.core.masonry.api",
+        "requires": ["poetry-core"],
+    },
+    "Hatchling": {
+        "requires": ["hatchling"],
+        "build-backend": "hatchling.build",
+    },
+    "PDM-backend": {"requires": ["pdm.backend"], "build-backend": "pdm.backend"},
+    "Flit-core": {
+        "requires": ["flit-core"],
+        "build-backend": "flit_core.buildapi",
+    },
+}
+"""The `build-system` table for each supported build backend."""
+
+_DEFAULT_URLS: models.ProjectUrls = {
+    "homepage": "https://todo.com",
+    "source": "https://todo.com",
+    "download": "https://todo.com",
+    "changelog": "https://todo.com",
+    "releasenotes": "https://todo.com",
+    "documentation": "https://todo.com",
+    "issues": "https://todo.com",
+    "funding": "https://todo.com",
+}
+"""Placeholder `project.urls` table for a new project."""
 
 
 def build_toml(config: models.Config) -> models.ProjectToml:
     """Build a pyproject.toml file from a configuration."""
-    if config["project_config"]["build_backend"] is not None:
-        if config["project_config"]["build_backend"] == "Setuptools":
-            build_system: models.BuildSystem = {
-                "build-backend": "setuptools.build_meta",
-                "requires": ["setuptools"],
-            }
-        elif config["project_config"]["build_backend"] == "Poetry-core":
-            build_system = {
-                "build-backend": "poetry.core.masonry.api",
-                "requires": ["poetry-core"],
-            }
-        elif config["project_config"]["build_backend"] == "Hatchling":
-            build_system = {
-                "requires": ["hatchling"],
-                "build-backend": "hatchling.build",
-            }
-        elif config["project_config"]["build_backend"] == "PDM-backend":
-            build_system = {"requires": ["pdm.backend"], "build-backend": "pdm.backend"}
-        elif config["project_config"]["build_backend"] == "Flit-core":
-            build_system = {
-                "requires": ["flit-core"],
-                "build-backend": "flit_core.buildapi",
-            }
-        else:
-            raise NotImplementedError(
-                f"Build backend {config['project_config']['build_backend']} not supported."
+    project_config = config["project_config"]
+    user_config = config["user_config"]
+    if project_config["build_backend"] is not None:
+        try:
+            build_system: models.BuildSystem = copy.deepcopy(
+                _BUILD_SYSTEMS[project_config["build_backend"]]
             )
+        except KeyError as e:
+            raise NotImplementedError(
+                f"Build backend {project_config['build_backend']} not supported."
+            ) from e
     else:
         build_system = {"requires": [], "build-backend": ""}
 
     project: models.ProjectTable = {
-        "name": config["project_config"]["project_name"],
+        "name": project_config["project_name"],
         "version": "0.0.0",
         "description": "",
         "readme": consts.README_FNAME,
-        "requires-python": f">={config['project_config']['min_py_version']}",
-        "license": config["project_config"]["pkg_license"],
+        "requires-python": f">={project_config['min_py_version']}",
+        "license": project_config["pkg_license"],
         "license-files": [],
         "authors": [
             {
-                "name": config["user_config"]["author"],
-                "email": config["user_config"]["author_email"],
+                "name": user_config["author"],
+                "email": user_config["author_email"],
             }
         ],
         "maintainers": [
             {
-                "name": config["user_config"]["author"],
-                "email": config["user_config"]["author_email"],
+                "name": user_config["author"],
+                "email": user_config["author_email"],
             }
         ],
         "keywords": [],
         "classifiers": [],
-        "urls": {
-            "homepage": "https://todo.com",
-            "source": "https://todo.com",
-            "download": "https://todo.com",
-            "changelog": "https://todo.com",
-            "releasenotes": "https://todo.com",
-            "documentation": "https://todo.com",
-            "issues": "https://todo.com",
-            "funding": "https://todo.com",
-        },
+        "urls": _DEFAULT_URLS.copy(),
         "dependencies": [],
         "optional-dependencies": {},
         "dynamic": [],
@@ -81,15 +93,13 @@ def build_toml(config: models.Config) -> models.ProjectToml:
 
     dependency_groups: models.Dependencies = {
         "tests": ["pytest"],
-        "static_checkers": [*config["project_config"]["static_code_checkers"]],
-        "formatters": [*config["project_config"]["formatters"]],
-        "docs": (
-            [config["project_config"]["docs"]] if config["project_config"]["docs"] else []
-        ),
+        "static_checkers": [*project_config["static_code_checkers"]],
+        "formatters": [*project_config["formatters"]],
+        "docs": [project_config["docs"]] if project_config["docs"] else [],
     }
 
     tool_config: dict[str, dict] = {}
-    if config["project_config"]["build_backend"] == "Hatchling":
+    if project_config["build_backend"] == "Hatchling":
         tool_config["hatch"] = {
             "build": {
                 "targets": {
@@ -98,7 +108,7 @@ def build_toml(config: models.Config) -> models.ProjectToml:
                         "exclude": [],
                     },
                     "wheel": {
-                        "packages": [f"src/{config['project_config']['project_name']}"],
+                        "packages": [f"src/{project_config['project_name']}"],
                     },
                 }
             }
@@ -112,153 +122,192 @@ def build_toml(config: models.Config) -> models.ProjectToml:
     }
 
 
-def build_pre_commit_config(config: models.Config, project_root: Path) -> None:
+@dataclass(slots=True)
+class BuildContext:
+    """The state shared by the builders while a project is being created."""
+
+    project_config: models.ProjectConfig
+    project_root: Path
+    project_toml: models.ProjectToml
+    """The pyproject.toml content, updated in place by the builders."""
+    batch: WriteBatch
+    """The queue of files generated by the builders."""
+    file_config: bool
+    """Whether tools are configured in stand-alone files rather than pyproject.toml."""
+
+
+def build_pre_commit_config(ctx: BuildContext) -> None:
     """Build a pre-commit configuration file."""
-    if config["project_config"]["pre_commit"]:
-        with open(project_root / ".pre-commit-config.yaml", "w", encoding="utf-8") as f:
-            f.write(templates.PRE_COMMIT_CONTENT)
-
-
-def build_static_checkers(config: models.Config, project_root: Path) -> None:
-    """Build static code checkers configuration files."""
-    with open(project_root / consts.PYPROJECT_TOML_FNAME, "r", encoding="utf-8") as f:
-        project_toml: models.ProjectToml = toml.load(f)  # type: ignore
-
-    file_config: bool = config["project_config"]["configuration_preference"] == "stand_alone"
-    if "flake8" in config["project_config"]["static_code_checkers"]:
-        with open(project_root / ".flake8", "w", encoding="utf-8") as f:
-            f.write(f"[flake8]\nmax-line-length = {consts.DEFAULT_RULER_LEN}\n")
-
-    if "mypy" in config["project_config"]["static_code_checkers"]:
-        if file_config:
-            with open(project_root / ".mypy.ini", "w", encoding="utf-8") as f:
-                f.write("[mypy]\n\n")
-        else:
-            project_toml["tool"]["mypy"] = {"python_version": "3.12", "exclude": []}
-
-    if "pyright" in config["project_config"]["static_code_checkers"]:
-        if file_config:
-            with open(project_root / "pyrightconfig.json", "w", encoding="utf-8") as f:
-                f.write("{}\n\n")
-        else:
-            project_toml["tool"]["pyright"] = {}
-
-    if "pylint" in config["project_config"]["static_code_checkers"]:
-        if file_config:
-            with open(project_root / ".pylintrc", "w", encoding="utf-8") as f:
-                f.write("[MASTER]\n\n")
-        else:
-            project_toml["tool"]["pylint"] = {"disable": []}
-
-    with open(project_root / consts.PYPROJECT_TOML_FNAME, "w", encoding="utf-8") as f:
-        toml.dump(project_toml, f)
-
-
-def build_formatter(config: models.Config, project_root: Path) -> None:
-    """Build a formatter configuration file."""
-    with open(project_root / consts.PYPROJECT_TOML_FNAME, "r", encoding="utf-8") as f:
-        project_toml: models.ProjectToml = toml.load(f)  # type: ignore
-
-    file_config: bool = config["project_config"]["configuration_preference"] == "stand_alone"
-    if "ruff" in config["project_config"]["formatters"]:
-        if file_config:
-            with open(project_root / "ruff.toml", "w", encoding="utf-8") as f:
-                f.write(templates.RUFF_CONFIG_CONTENT)
-        else:
-            project_toml["tool"]["ruff"] = {
-                "exclude": [],
-                "line-length": consts.DEFAULT_RULER_LEN,
-                "indent-width": 4,
-                "lint": {"ignore": []},
-                "format": {"quote-style": "double", "indent-style": "space"},
-            }
+    if ctx.project_config["pre_commit"]:
+        ctx.batch.write(
+            ctx.project_root / ".pre-commit-config.yaml", templates.PRE_COMMIT_CONTENT
+        )
+
+
+_ConfigHandler = Callable[[BuildContext], None]
+"""Writes the configuration of one tool."""
+
+
+def _configure_flake8(ctx: BuildContext) -> None:
+    # flake8 cannot be configured from pyproject.toml
+    ctx.batch.write(
+        ctx.project_root / ".flake8",
+        f"[flake8]\nmax-line-length = {consts.DEFAULT_RULER_LEN}\n",
+    )
+
+
+def _configure_mypy(ctx: BuildContext) -> None:
+    if ctx.file_config:
+        ctx.batch.write(ctx.project_root / ".mypy.ini", "[mypy]\n\n")
+    else:
+        ctx.project_toml["tool"]["mypy"] = {"python_version": "3.12", "exclude": []}
+
+
+def _configure_pyright(ctx: BuildContext) -> None:
+    if ctx.file_config:
+        ctx.batch.write(ctx.project_root / "pyrightconfig.json", "{}\n\n")
+    else:
+        ctx.project_toml["tool"]["pyright"] = {}
+
+
+def _configure_pylint(ctx: BuildContext) -> None:
+    if ctx.file_config:
+        ctx.batch.write(ctx.project_root / ".pylintrc", "[MASTER]\n\n")
+    else:
+        ctx.project_toml["tool"]["pylint"] = {"disable": []}
 
-    if "isort" in config["project_config"]["formatters"]:
-        if file_config:
-            with open(project_root / ".isort.cfg", "w", encoding="utf-8") as f:
-                f.write("[settings]\nprofile=black\n\n")
-        else:
-            project_toml["tool"]["isort"] = {
-                "profile": "black",
-                "line_length": consts.DEFAULT_RULER_LEN,
-                "indent": 4,
-            }
 
-    with open(project_root / consts.PYPROJECT_TOML_FNAME, "w", encoding="utf-8") as f:
-        toml.dump(project_toml, f)
+def _configure_ruff(ctx: BuildContext) -> None:
+    if ctx.file_config:
+        ctx.batch.write(ctx.project_root / "ruff.toml", templates.RUFF_CONFIG_CONTENT)
+    else:
+        ctx.project_toml["tool"]["ruff"] = {
+            "exclude": [],
+            "line-length": consts.DEFAULT_RULER_LEN,
+            "indent-width": 4,
+            "lint": {"ignore": []},
+            "format": {"quote-style": "double", "indent-style": "space"},
+        }
+
+
+def _configure_isort(ctx: BuildContext) -> None:
+    if ctx.file_config:
+        ctx.batch.write(ctx.project_root / ".isort.cfg", "[settings]\nprofile=black\n\n")
+    else:
+        ctx.project_toml["tool"]["isort"] = {
+            "profile": "black",
+            "line_length": consts.DEFAULT_RULER_LEN,
+            "indent": 4,
+        }
+
+
+_CHECKER_HANDLERS: dict[str, _ConfigHandler] = {
+    "flake8": _configure_flake8,
+    "mypy": _configure_mypy,
+    "pyright": _configure_pyright,
+    "pylint": _configure_pylint,
+}
+"""Configuration handlers for the supported static code checkers."""
+
+_FORMATTER_HANDLERS: dict[str, _ConfigHandler] = {
+    "ruff": _configure_ruff,
+    "isort": _configure_isort,
+}
+"""Configuration handlers for the supported formatters; black needs no configuration."""
+
+
+def build_static_checkers(ctx: BuildContext) -> None:
+    """Build static code checkers configuration files.
+
+    Checkers configured in pyproject.toml are added to `ctx.project_toml` in place.
+    """
+    checkers = set(ctx.project_config["static_code_checkers"])
+    # iterate the handler table so that the generated tool tables keep a stable order
+    for name, handler in _CHECKER_HANDLERS.items():
+        if name in checkers:
+            handler(ctx)
+
 
+def build_formatter(ctx: BuildContext) -> None:
+    """Build a formatter configuration file.
 
-def build_tests(config: models.Config, project_root: Path) -> None:
-    """Build a test configuration file."""
-    tests_folder = project_root / "tests"
-    tests_folder.mkdir()
-    with open(tests_folder / "__init__.py", "w", encoding="utf-8") as f:
-        f.write("")
+    Formatters configured in pyproject.toml are added to `ctx.project_toml` in place.
+    """
+    formatters = set(ctx.project_config["formatters"])
+    for name, handler in _FORMATTER_HANDLERS.items():
+        if name in formatters:
+            handler(ctx)
 
-    with open(project_root / consts.PYPROJECT_TOML_FNAME, "r", encoding="utf-8") as f:
-        project_toml: models.ProjectToml = toml.load(f)  # type: ignore
 
-    file_config: bool = config["project_config"]["configuration_preference"] == "stand_alone"
+def build_tests(ctx: BuildContext) -> None:
+    """Build a test configuration file.
 
-    if file_config:
-        with open(project_root / "pytest.ini", "w", encoding="utf-8") as f:
-            f.write(templates.PYTEST_CONFIG_CONTENT)
+    If pytest is configured in pyproject.toml, `ctx.project_toml` is updated in place.
+    """
+    tests_folder = ctx.project_root / "tests"
+    # a flat-layout project named "tests" also queues this folder as its package
+    ctx.batch.mkdir(tests_folder)
+    ctx.batch.write(tests_folder / "__init__.py", "")
+
+    if ctx.file_config:
+        ctx.batch.write(ctx.project_root / "pytest.ini", templates.PYTEST_CONFIG_CONTENT)
     else:
-        project_toml["tool"]["pytest"] = {"addopts": templates.PYTEST_ADDOPTS}
-    with open(project_root / consts.PYPROJECT_TOML_FNAME, "w", encoding="utf-8") as f:
-        toml.dump(project_toml, f)
+        ctx.project_toml["tool"]["pytest"] = {"addopts": templates.PYTEST_ADDOPTS}
 
 
-def build_editor_config(config: models.Config, project_root: Path) -> None:
+def build_editor_config(ctx: BuildContext) -> None:
     """Build a code editor configuration file."""
-    if config["project_config"]["code_editor"] == "vscode":
-        with open(
-            project_root / f"{config['project_config']['project_name']}.code-workspace",
-            "w",
-            encoding="utf-8",
-        ) as f:
-            json.dump(templates.CODE_WORKSPACE_CONTENT, f, indent=2)
+    if ctx.project_config["code_editor"] == "vscode":
+        ctx.batch.write(
+            ctx.project_root / f"{ctx.project_config['project_name']}.code-workspace",
+            json.dumps(templates.CODE_WORKSPACE_CONTENT, indent=2),
+        )
 
 
-def build_docs(config: models.Config, project_root: Path) -> None:
+def build_docs(ctx: BuildContext) -> None:
     """Build a documentation configuration file."""
-    docs_config: str | None = config["project_config"]["docs"]
-    if config["project_config"]["docs"] is None:
+    docs_config: str | None = ctx.project_config["docs"]
+    if docs_config is None:
         return
     if docs_config == "mkdocs":
-        with open(project_root / "mkdocs.yml", "w", encoding="utf-8") as f:
-            f.write(templates.build_mk_docs_config(config["project_config"]["project_name"]))
-        docs_folder = project_root / "docs"
-        docs_folder.mkdir()
-        with open(docs_folder / "index.md", "w", encoding="utf-8") as f:
-            f.write("# Documentation\n\n")
-            f.write("This is the documentation for your project.\n\n")
+        ctx.batch.write(
+            ctx.project_root / "mkdocs.yml",
+            templates.build_mk_docs_config(ctx.project_config["project_name"]),
+        )
+        docs_folder = ctx.project_root / "docs"
+        ctx.batch.mkdir(docs_folder)
+        ctx.batch.write(
+            docs_folder / "index.md",
+            "# Documentation\n\nThis is the documentation for your project.\n\n",
+        )
     else:
         raise NotImplementedError(
             f"{docs_config} documentation generation is not yet implemented."
         )
 
 
-def build_cloud_code_base(config: models.Config, project_root: Path) -> None:
+def build_cloud_code_base(ctx: BuildContext) -> None:
     """Build a cloud code base configuration file."""
-    if config["project_config"]["cloud_code_base"] is None:
+    if ctx.project_config["cloud_code_base"] is None:
         return
-    if config["project_config"]["cloud_code_base"] == "github":
-        action_path = project_root / ".github" / "workflows"
-        action_path.mkdir(parents=True)
-        with open(project_root / ".github/workflows/ci.yml", "w", encoding="utf-8") as f:
-            f.write(templates.build_gh_action_ci(config["project_config"]["min_py_version"]))
-        with open(project_root / ".github/workflows/release.yml", "w", encoding="utf-8") as f:
-            f.write(
-                templates.build_gh_action_release(config["project_config"]["project_name"])
-            )
+    if ctx.project_config["cloud_code_base"] == "github":
+        action_path = ctx.project_root / ".github" / "workflows"
+        ctx.batch.mkdir(action_path.parent)
+        ctx.batch.mkdir(action_path)
+        ctx.batch.write(
+            action_path / "ci.yml",
+            templates.build_gh_action_ci(ctx.project_config["min_py_version"]),
+        )
+        ctx.batch.write(
+            action_path / "release.yml",
+            templates.build_gh_action_release(ctx.project_config["project_name"]),
+        )
 
 
-def build_vcs(project_root: Path) -> None:
+def build_vcs(project_root: Path, quiet: bool = False) -> None:
     """Build a version control system configuration file."""
     # Create .gitignore file
-    with open(project_root / ".gitignore", "w", encoding="utf-8") as f:
-        f.write(templates.GITIGNORE_CONTENT)
+    (project_root / ".gitignore").write_bytes(templates.GITIGNORE_CONTENT)
     try:
         subprocess.run(
             ["git", "init"],
@@ -290,42 +339,80 @@ def build_vcs(project_root: Path) -> None:
         )
     except subprocess.CalledProcessError as e:
         print(f"⚠️ Failed to initialize git repository: {e}")
-    print(f"📦 Git repository initialized at {project_root}.")
+    if not quiet:
+        print(f"📦 Git repository initialized at {project_root}.")
 
 
-def build_basic_project(config: models.Config) -> None:
-    """Build a basic Python project."""
-    print("🚧 Building your project...")
-    project_root = consts.CWD / config["project_config"]["project_name"]
-    if project_root.exists() and project_root.is_dir() and any(project_root.iterdir()):
-        print(f"🚨 Project directory {project_root} already exists and is not empty.")
-        sys.exit(1)
+def _render_pyproject(project_toml: models.ProjectToml) -> str:
+    content = templates.build_pyproject_toml(project_toml)
+    if project_toml["tool"]:
+        # tool tables are free-form, so leave them to a real TOML serializer
+        import tomli_w  # pylint: disable=C0415
 
-    project_toml: models.ProjectToml = build_toml(config)
-    project_root.mkdir()
-    with open(project_root / consts.PYPROJECT_TOML_FNAME, "w", encoding="utf-8") as f:
-        toml.dump(project_toml, f)
+        content += "\n" + tomli_w.dumps({"tool": project_toml["tool"]})
+    return content
 
-    with open(project_root / consts.README_FNAME, "w", encoding="utf-8") as f:
-        f.write(templates.build_readme(config["project_config"]["project_name"]))
 
-    if config["project_config"]["layout"] == "flat":
-        src_folder = project_root / config["project_config"]["project_name"]
-    else:
-        src_folder = project_root / "src" / config["project_config"]["project_name"]
-    src_folder.mkdir(parents=True)
-    with open(src_folder / "__init__.py", "w", encoding="utf-8") as f:
-        f.write("")
+def _is_non_empty_dir(path: Path) -> bool:
+    if not path.is_dir():
+        return False
+    with os.scandir(path) as entries:
+        return next(entries, None) is not None
 
-    build_tests(config, project_root)
 
-    build_pre_commit_config(config, project_root)
+def build_basic_project(config: models.Config, quiet: bool = False) -> None:
+    """Build a basic Python project.
 
-    build_static_checkers(config, project_root)
-    build_formatter(config, project_root)
-    build_editor_config(config, project_root)
-    build_docs(config, project_root)
-    build_cloud_code_base(config, project_root)
-    build_vcs(project_root)
+    Progress messages are suppressed if `quiet` is set; errors are always reported.
+    """
+    project_config = config["project_config"]
+    if not quiet:
+        print("🚧 Building your project...")
+    project_root = consts.CWD / project_config["project_name"]
+    if _is_non_empty_dir(project_root):
+        print(f"🚨 Project directory {project_root} already exists and is not empty.")
+        sys.exit(1)
 
-    print(f"🎉 Project {config['project_config']['project_name']} created successfully.")
+    ctx = BuildContext(
+        project_config=project_config,
+        project_root=project_root,
+        project_toml=build_toml(config),
+        batch=WriteBatch(),
+        file_config=project_config["configuration_preference"] == "stand_alone",
+    )
+    ctx.batch.mkdir(project_root)
+
+    ctx.batch.write(
+        project_root / consts.README_FNAME,
+        templates.build_readme(project_config["project_name"]),
+    )
+
+    if project_config["layout"] == "flat":
+        src_folder = project_root / project_config["project_name"]
+    else:
+        ctx.batch.mkdir(project_root / "src")
+        src_folder = project_root / "src" / project_config["project_name"]
+    ctx.batch.mkdir(src_folder)
+    ctx.batch.write(src_folder / "__init__.py", "")
+
+    build_tests(ctx)
+
+    build_pre_commit_config(ctx)
+
+    build_static_checkers(ctx)
+    build_formatter(ctx)
+    # pyproject.toml is written once, after every builder has contributed to it
+    ctx.batch.write(
+        project_root / consts.PYPROJECT_TOML_FNAME, _render_pyproject(ctx.project_toml)
+    )
+
+    build_editor_config(ctx)
+    build_docs(ctx)
+    build_cloud_code_base(ctx)
+    # nothing is created on disk until here; git needs every generated file
+    # in place before the initial commit
+    ctx.batch.flush()
+    build_vcs(project_root, quiet)
+
+    if not quiet:
+        print(f"🎉 Project {project_config['project_name']} created successfully.")
@@ -34,6 +34,12 @@ MAIN_ARGS.add_argument(
     action="store_true",
     help="Skip the configuration process and generate a basic project.",
 )
+MAIN_ARGS.add_argument(
+    "-q",
+    "--quiet",
+    action="store_true",
+    help="Do not print progress messages while building the project.",
+)
 
 
 def prompt_for_user_config(git_user_config: UserConfig | None) -> UserConfig:
@@ -277,8 +283,7 @@ def copy_workspace_file(dest_folder: Path) -> None:
     destination.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(destination, "w", encoding="utf8") as f:
-            f.write(workspace_file.read_text(encoding="utf8"))
+        destination.write_text(workspace_file.read_text(encoding="utf8"), encoding="utf8")
     except FileNotFoundError as e:
         print(f"❌ Failed to copy workspace file: {e}")
 
@@ -289,16 +294,20 @@ def main() -> None:
     config_folder = _get_appdata_path() / "scaffoldpy"
     config_folder.mkdir(parents=True, exist_ok=True)
     config_path = config_folder / consts.SELF_CONFIG_FNAME
-    project_name: str | None = MAIN_ARGS.parse_args().project_name
+    args = MAIN_ARGS.parse_args()
+    project_name: str | None = args.project_name
+    quiet: bool = args.quiet
     update_needed: bool = False
     git_user_config: UserConfig | None = get_user_config()
     try:
-        print(f"🚀 Trying to load config file from {config_path}...")
+        if not quiet:
+            print(f"🚀 Trying to load config file from {config_path}...")
         with open(config_path, "r", encoding="utf8") as f:
             config = PydConfig.validate_python(ujson5.load(f))
             user_config: UserConfig = config["user_config"]
             project_config: ProjectConfig = config["project_config"]
-        print(f"🌟 Welcome back {user_config['author']}!")
+        if not quiet:
+            print(f"🌟 Welcome back {user_config['author']}!")
         if git_user_config is not None and user_config != git_user_config:
             print(
                 "⚠️ Looks like your git user configuration is different from your "
@@ -313,17 +322,19 @@ def main() -> None:
             ).execute()
             if update_user_config:
                 user_config = git_user_config
-        if MAIN_ARGS.parse_args().skip_config:
+        if args.skip_config:
             _project_name: str = (
                 project_name if project_name is not None else prompt_for_project_name()
             )
             project_config["project_name"] = _project_name
-            print("👋 Skipping configuration process.")
+            if not quiet:
+                print("👋 Skipping configuration process.")
             build_basic_project(
                 {
                     "user_config": user_config,
                     "project_config": project_config,
-                }
+                },
+                quiet,
             )
             return
         use_prev = inquirer.confirm(
@@ -358,7 +369,8 @@ def main() -> None:
                 "project_config": project_config,
             },
         )
-        print(f"✅ Configuration saved at {config_path}.")
+        if not quiet:
+            print(f"✅ Configuration saved at {config_path}.")
         dump_schema(config_folder / consts.SELF_CONFIG_SCHEMA_FNAME)
         copy_workspace_file(config_folder)
 
@@ -366,14 +378,16 @@ def main() -> None:
         {
             "user_config": user_config,
             "project_config": project_config,
-        }
+        },
+        quiet,
     )
 
 
 if __name__ == "__main__":
-    main_project_name: str | None = MAIN_ARGS.parse_args().project_name
+    main_args = MAIN_ARGS.parse_args()
+    main_project_name: str | None = main_args.project_name
     main_git_user_config: UserConfig = get_user_config() or {"author": "", "author_email": ""}
-    if MAIN_ARGS.parse_args().skip_config:
+    if main_args.skip_config:
         main_project_config = DEFAULT_PROJECT_CONFIG.copy()
         if main_project_name is not None:
             main_project_config["project_name"] = main_project_name
@@ -381,7 +395,8 @@ if __name__ == "__main__":
             {
                 "user_config": main_git_user_config,
                 "project_config": main_project_config,
-            }
+            },
+            main_args.quiet,
         )
         sys.exit(0)
     main_user_config = main_git_user_config
@@ -391,5 +406,6 @@ if __name__ == "__main__":
         {
             "user_config": main_user_config,
             "project_config": main_project_config,
-        }
+        },
+        main_args.quiet,
     )
@@ -1,6 +1,9 @@
 """Templates for scaffoldpy."""
 
-from scaffoldpy import consts
+import json
+from typing import Final, cast
+
+from scaffoldpy import consts, models
 
 
 def build_gh_action_ci(min_py_version: str) -> str:
@@ -122,6 +125,68 @@ jobs:
 """
 
 
+def _toml_value(value: str | list[str]) -> str:
+    # JSON strings and arrays of strings are valid TOML basic strings and arrays, except
+    # that JSON leaves DEL unescaped while TOML forbids it as a literal character
+    return json.dumps(value, ensure_ascii=False).replace("\x7f", "\\u007f")
+
+
+def _toml_contacts(contacts: list[models.NameContact]) -> str:
+    return (
+        "["
+        + ", ".join(
+            f"{{ name = {_toml_value(c['name'])}, email = {_toml_value(c['email'])} }}"
+            for c in contacts
+        )
+        + "]"
+    )
+
+
+def build_pyproject_toml(project_toml: models.ProjectToml) -> str:
+    """Build pyproject.toml content without the `tool` table.
+
+    Only the keys generated by `builders.build_toml` are rendered; the `tool`
+    table is free-form and is left to a TOML serializer.
+    """
+    build_system = project_toml["build-system"]
+    project = project_toml["project"]
+    # TypedDict.items() erases the value type; every project URL is a string
+    urls = "".join(
+        f"{k} = {_toml_value(v)}\n" for k, v in cast(dict[str, str], project["urls"]).items()
+    )
+    optional_dependencies = "".join(
+        f"{k} = {_toml_value(v)}\n" for k, v in project["optional-dependencies"].items()
+    )
+    dependency_groups = "".join(
+        f"{k} = {_toml_value(v)}\n" for k, v in project_toml["dependency-groups"].items()
+    )
+    return f"""[build-system]
+requires = {_toml_value(build_system["requires"])}
+build-backend = {_toml_value(build_system["build-backend"])}
+
+[project]
+name = {_toml_value(project["name"])}
+version = {_toml_value(project["version"])}
+description = {_toml_value(project["description"])}
+readme = {_toml_value(project["readme"])}
+requires-python = {_toml_value(project["requires-python"])}
+license = {_toml_value(project["license"])}
+license-files = {_toml_value(project["license-files"])}
+authors = {_toml_contacts(project["authors"])}
+maintainers = {_toml_contacts(project["maintainers"])}
+keywords = {_toml_value(project["keywords"])}
+classifiers = {_toml_value(project["classifiers"])}
+dependencies = {_toml_value(project["dependencies"])}
+dynamic = {_toml_value(project["dynamic"])}
+
+[project.urls]
+{urls}
+[project.optional-dependencies]
+{optional_dependencies}
+[dependency-groups]
+{dependency_groups}"""
+
+
 def build_mk_docs_config(project_name: str) -> str:
     """Build mkdocs.yml configuration."""
     return f"""site_name: {project_name}
@@ -131,7 +196,7 @@ nav:
 """
 
 
-RUFF_CONFIG_CONTENT = f"""
+RUFF_CONFIG_CONTENT: Final[bytes] = f"""
 exclude = []
 line-length = {consts.DEFAULT_RULER_LEN}
 indent-width = 4
@@ -143,9 +208,9 @@ ignore = []
 quote-style = \"double\"
 indent-style = \"space\"
 
-"""
+""".encode("utf-8")
 
-PRE_COMMIT_CONTENT = """repos:
+PRE_COMMIT_CONTENT: Final[bytes] = """repos:
   - repo: https://github.com/pre-commit/pre-commit-hooks
     rev: v5.0.0
     hooks:
@@ -155,9 +220,9 @@ PRE_COMMIT_CONTENT = """repos:
       - id: check-toml
       - id: check-added-large-files
 
-"""
+""".encode("utf-8")
 
-CODE_WORKSPACE_CONTENT: dict = {
+CODE_WORKSPACE_CONTENT: Final[dict] = {
     "folders": [{"path": "."}],
     "settings": {
         "python.defaultInterpreterPath": "${workspaceFolder}/.venv/Scripts/python.exe",
@@ -168,17 +233,17 @@ CODE_WORKSPACE_CONTENT: dict = {
     },
 }
 
-PYTEST_ADDOPTS = (
+PYTEST_ADDOPTS: Final[str] = (
     "--cov . --cov-report xml:tests/.coverage/cov.xml --cov-report html:tests/.coverage/html"
 )
 
-PYTEST_CONFIG_CONTENT = f"""[pytest]
+PYTEST_CONFIG_CONTENT: Final[bytes] = f"""[pytest]
 ; https://pytest-cov.readthedocs.io/en/latest/config.html
 addopts = {PYTEST_ADDOPTS}
 
-"""
+""".encode("utf-8")
 
-GITIGNORE_CONTENT = """# Byte-compiled / optimized / DLL files
+GITIGNORE_CONTENT: Final[bytes] = """# Byte-compiled / optimized / DLL files
 __pycache__/
 *.py[cod]
 *$py.class
@@ -212,7 +277,7 @@ demo/*
 .venv/
 
 _version.py
-"""
+""".encode("utf-8")
 
 
 def build_readme(project_name: str) -> str:
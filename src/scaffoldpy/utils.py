@@ -17,3 +17,45 @@ def dump_schema(path: Path) -> None:
     """Dump the schema to a file."""
     with open(path, "w", encoding="utf8") as f:
         ujson5.dump(PydConfig.json_schema(), f, indent=2)
+
+
+class WriteBatch:
+    """A queue of directories and file writes that are flushed to disk together.
+
+    Builders queue the folders and files they generate with `mkdir` and `write`
+    and the project builder flushes them in one pass once every builder has run.
+    Directories are created first, shallowest first and then by path, and each
+    queued file is then written once.
+    """
+
+    def __init__(self) -> None:
+        self._dirs: set[Path] = set()
+        self._writes: dict[Path, str | bytes] = {}
+
+    def mkdir(self, path: Path) -> None:
+        """Queue the directory `path` to be created.
+
+        Parents are not created implicitly: the parent of `path` must already exist or
+        be queued as well. Queuing the same directory twice creates it once.
+        """
+        self._dirs.add(path)
+
+    def write(self, path: Path, content: str | bytes) -> None:
+        """Queue `content` to be written to `path`.
+
+        `str` content is encoded as UTF-8; `bytes` content is written as is. A later
+        write to the same path replaces the queued content.
+        """
+        self._writes[path] = content
+
+    def flush(self) -> None:
+        """Create all queued directories, write all queued files and clear the queue.
+
+        Raises `FileExistsError` if a queued directory already exists.
+        """
+        for path in sorted(self._dirs, key=lambda p: (len(p.parts), p)):
+            path.mkdir()
+        for path, content in self._writes.items():
+            path.write_bytes(content.encode("utf-8") if isinstance(content, str) else content)
+        self._dirs.clear()
+        self._writes.clear()
@@ -0,0 +1,157 @@
+"""Test the project builders in scaffoldpy.builders."""
+
+import sys
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from scaffoldpy import consts
+from scaffoldpy.builders import (
+    _BUILD_SYSTEMS,
+    BuildContext,
+    _render_pyproject,
+    build_basic_project,
+    build_formatter,
+    build_static_checkers,
+    build_tests,
+    build_toml,
+)
+from scaffoldpy.utils import WriteBatch
+from scaffoldpy.models import DEFAULT_PROJECT_CONFIG, ProjectConfig, UserConfig
+
+if sys.version_info < (3, 11):
+    import tomli as tomllib
+else:
+    import tomllib
+
+USER_CONFIG: UserConfig = {"author": "John Doe", "author_email": "john.doe@example.com"}
+
+
+def build_project(
+    tmp_path: Path,
+    monkeypatch,
+    user_config: UserConfig = USER_CONFIG,
+    quiet: bool = True,
+    **project_config,
+) -> Path:
+    """Build a project into `tmp_path` and return its root folder."""
+    monkeypatch.setattr(consts, "CWD", tmp_path)
+    config = cast(ProjectConfig, {**DEFAULT_PROJECT_CONFIG, **project_config})
+    build_basic_project({"user_config": user_config, "project_config": config}, quiet)
+    return tmp_path / config["project_name"]
+
+
+def test_build_basic_project_quiet(tmp_path, monkeypatch, capsys):
+    """Test that quiet suppresses the progress messages."""
+    build_project(tmp_path, monkeypatch, quiet=True)
+    out = capsys.readouterr().out
+    assert "🚧" not in out
+    assert "📦" not in out
+    assert "🎉" not in out
+
+
+def test_build_basic_project_progress(tmp_path, monkeypatch, capsys):
+    """Test that progress messages are printed by default."""
+    build_project(tmp_path, monkeypatch, quiet=False)
+    out = capsys.readouterr().out
+    assert "🚧 Building your project..." in out
+    assert "🎉 Project example created successfully." in out
+
+
+@pytest.mark.parametrize("configuration_preference", ["stand_alone", "pyproject_toml"])
+@pytest.mark.parametrize("build_backend", ["Hatchling", None])
+def test_build_basic_project_pyproject(
+    tmp_path, monkeypatch, configuration_preference, build_backend
+):
+    """Test that the generated pyproject.toml is valid TOML with the expected content."""
+    author = 'Jöhn "JD" D\\oe\x7f\t'
+    project_root = build_project(
+        tmp_path,
+        monkeypatch,
+        user_config={"author": author, "author_email": "john.doe@example.com"},
+        configuration_preference=configuration_preference,
+        build_backend=build_backend,
+    )
+
+    with open(project_root / consts.PYPROJECT_TOML_FNAME, "rb") as f:
+        pyproject = tomllib.load(f)
+
+    assert pyproject["project"]["name"] == "example"
+    assert pyproject["project"]["authors"] == [
+        {"name": author, "email": "john.doe@example.com"}
+    ]
+    assert pyproject["dependency-groups"]["formatters"] == ["ruff", "isort"]
+    if build_backend is None:
+        assert pyproject["build-system"] == {"requires": [], "build-backend": ""}
+        assert "hatch" not in pyproject.get("tool", {})
+    else:
+        assert pyproject["build-system"]["build-backend"] == "hatchling.build"
+        assert pyproject["tool"]["hatch"]["build"]["targets"]["wheel"]["packages"] == [
+            "src/example"
+        ]
+    if configuration_preference == "stand_alone":
+        assert "ruff" not in pyproject.get("tool", {})
+        assert (project_root / "ruff.toml").exists()
+    else:
+        assert pyproject["tool"]["ruff"]["line-length"] == consts.DEFAULT_RULER_LEN
+        assert "addopts" in pyproject["tool"]["pytest"]
+        assert not (project_root / "ruff.toml").exists()
+
+
+@pytest.mark.parametrize("configuration_preference", ["stand_alone", "pyproject_toml"])
+def test_build_basic_project_flat_named_tests(tmp_path, monkeypatch, configuration_preference):
+    """Test a flat-layout project whose package folder is also the tests folder."""
+    project_root = build_project(
+        tmp_path,
+        monkeypatch,
+        project_name="tests",
+        layout="flat",
+        configuration_preference=configuration_preference,
+    )
+
+    assert (project_root / "tests" / "__init__.py").is_file()
+    if configuration_preference == "stand_alone":
+        assert (project_root / "pytest.ini").is_file()
+    else:
+        with open(project_root / consts.PYPROJECT_TOML_FNAME, "rb") as f:
+            assert "addopts" in tomllib.load(f)["tool"]["pytest"]
+
+
+@pytest.mark.parametrize("configuration_preference", ["stand_alone", "pyproject_toml"])
+@pytest.mark.parametrize("build_backend", [*_BUILD_SYSTEMS, None])
+def test_render_pyproject_round_trip(tmp_path, configuration_preference, build_backend):
+    """Test that the rendered pyproject.toml parses back to the table it was rendered from."""
+    project_config = cast(
+        ProjectConfig,
+        {
+            **DEFAULT_PROJECT_CONFIG,
+            "configuration_preference": configuration_preference,
+            "build_backend": build_backend,
+        },
+    )
+    ctx = BuildContext(
+        project_config=project_config,
+        project_root=tmp_path,
+        project_toml=build_toml(
+            {"user_config": USER_CONFIG, "project_config": project_config}
+        ),
+        batch=WriteBatch(),
+        file_config=configuration_preference == "stand_alone",
+    )
+    build_tests(ctx)
+    build_static_checkers(ctx)
+    build_formatter(ctx)
+
+    expected = dict(ctx.project_toml)
+    if not expected["tool"]:
+        del expected["tool"]
+    assert tomllib.loads(_render_pyproject(ctx.project_toml)) == expected
+
+
+def test_build_basic_project_existing_empty_dir(tmp_path, monkeypatch):
+    """Test that an existing, empty project directory is not reused."""
+    (tmp_path / "example").mkdir()
+    with pytest.raises(FileExistsError):
+        build_project(tmp_path, monkeypatch)
+    assert not any((tmp_path / "example").iterdir())
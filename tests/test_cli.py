@@ -1,6 +1,10 @@
 """Test the CLI functions in scaffoldpy.cli."""
 
+import json
+
+from scaffoldpy import consts
 from scaffoldpy.cli import (
+    main,
     prompt_for_project_config,
     prompt_for_user_config,
 )
@@ -59,3 +63,28 @@ def test_prompt_for_project_config(mocker):
 
     # Assert the result
     assert result == DEFAULT_PROJECT_CONFIG
+
+
+def test_main_quiet(mocker, monkeypatch, tmp_path, capsys):
+    """Test that -q suppresses the status messages of a saved-config run."""
+    user_config = {"author": "John Doe", "author_email": "john.doe@example.com"}
+    config_folder = tmp_path / "appdata" / "scaffoldpy"
+    config_folder.mkdir(parents=True)
+    # JSON is valid JSON5, so the saved configuration can be written with json
+    (config_folder / consts.SELF_CONFIG_FNAME).write_text(
+        json.dumps({"user_config": user_config, "project_config": DEFAULT_PROJECT_CONFIG}),
+        encoding="utf8",
+    )
+    mocker.patch("scaffoldpy.cli._get_appdata_path", return_value=tmp_path / "appdata")
+    mocker.patch("scaffoldpy.cli.get_user_config", return_value=user_config)
+    mock_inquirer = mocker.patch("scaffoldpy.cli.inquirer")
+    monkeypatch.setattr(consts, "CWD", tmp_path)
+    monkeypatch.setattr("sys.argv", ["scaffoldpy", "-s", "-q", "demo"])
+
+    main()
+
+    out = capsys.readouterr().out
+    for message in ("🚀", "🌟", "👋", "🚧", "📦", "🎉"):
+        assert message not in out
+    assert (tmp_path / "demo" / consts.PYPROJECT_TOML_FNAME).is_file()
+    mock_inquirer.confirm.assert_not_called()
@@ -0,0 +1,34 @@
+"""Test the utility functions in scaffoldpy.utils."""
+
+from scaffoldpy.utils import WriteBatch
+
+
+def test_write_batch_flush(tmp_path):
+    """Test that WriteBatch only touches the disk when flushed."""
+    batch = WriteBatch()
+    # queue the deeper folder and its file first to check that parents come first
+    batch.write(tmp_path / "a" / "b" / "text.txt", "héllo\n")
+    batch.mkdir(tmp_path / "a" / "b")
+    batch.mkdir(tmp_path / "a")
+    batch.write(tmp_path / "a" / "raw.bin", b"\x00\x01")
+    assert not (tmp_path / "a").exists()
+
+    batch.flush()
+
+    assert (tmp_path / "a" / "b" / "text.txt").read_bytes() == "héllo\n".encode("utf-8")
+    assert (tmp_path / "a" / "raw.bin").read_bytes() == b"\x00\x01"
+
+
+def test_write_batch_replaces_queued_write(tmp_path):
+    """Test that a later write to the same path replaces the earlier one."""
+    batch = WriteBatch()
+    batch.write(tmp_path / "file.txt", "first")
+    batch.write(tmp_path / "file.txt", b"second")
+    batch.flush()
+
+    assert (tmp_path / "file.txt").read_text(encoding="utf-8") == "second"
+
+    # the queue is cleared, so flushing again does not rewrite the file
+    (tmp_path / "file.txt").write_text("edited", encoding="utf-8")
+    batch.flush()
+    assert (tmp_path / "file.txt").read_text(encoding="utf-8") == "edited"